@@ -131,8 +131,9 @@ class ConfigManager:
         normalized = self._normalize(config)
         self.path.parent.mkdir(parents=True, exist_ok=True)
         tmp_path = self.path.with_suffix(f"{self.path.suffix}.tmp")
-        with tmp_path.open("w", encoding="utf-8") as handle:
-            json.dump(normalized, handle, indent=4, sort_keys=True)
+        tmp_path.write_text(
+            json.dumps(normalized, indent=4, sort_keys=True), encoding="utf-8"
+        )
         tmp_path.replace(self.path)
         with self._lock:
             self._config = copy.deepcopy(normalized)
@@ -20,7 +20,11 @@ REQUEST_TIMEOUT = (15, 45)
 MAX_RETRIES = 5
 RETRY_BACKOFF = 2
 NGROK_TIMEOUT = 20
+NGROK_API_URL = "http://127.0.0.1:4040/api/tunnels"
 DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+LAN_ADDRESS_CACHE_TTL = 10
+PROC_DIR = Path("/proc")
+DEFAULT_ROUTE_FILE = PROC_DIR / "net" / "route"
 
 MAX_RAM_PERCENTAGE = 80
 MONITOR_INTERVAL = 60
@@ -36,6 +40,15 @@ ALLOWED_FILENAME_CHARS = re.compile(r"^[a-zA-Z0-9_.-]+$")
 INVALID_FILENAME_CHARS = re.compile(r"[^a-zA-Z0-9_.-]")
 COLLAPSE_DOTS_PATTERN = re.compile(r"\.{2,}")
 WORLD_SUFFIX_PATTERN = re.compile(r"^world(?:[_.-].+)?$", re.IGNORECASE)
+# Matches `screen [opts] -S <name>` / `SCREEN -dmS <name>` in NUL-separated
+# /proc cmdlines, one process per line. Clients (-X, -r, -ls) are not sessions.
+SCREEN_SESSION_PATTERN = re.compile(
+    rb"^(?![^\n]*\0-(?:X|r|ls)\0)(?:[^\0\n]*/)?(?i:screen)\0"
+    rb"(?:[^\0\n]*\0)*?-[a-zA-Z]*S\0([^\0\n]+)",
+    re.MULTILINE,
+)
+# First quoted version in `java -version` output, e.g. "17.0.9" or "1.8.0_392".
+JAVA_VERSION_PATTERN = re.compile(r'"(\d+)(?:\.(\d+))?[^"\s]*"')
 
 BACKUP_COMPRESSION = zipfile.ZIP_DEFLATED
 BACKUP_COMPRESSION_LEVEL = 6
@@ -46,6 +59,9 @@ TUNNEL_PID_FILE_NAME = ".msm.tunnel.pid"
 PLAYIT_SECRET_FILE_NAME = ".msm.playit.secret"
 SERVER_PROPERTIES_FILE = "server.properties"
 EULA_FILE = "eula.txt"
+# server.properties keys mirrored into each server's "server_settings" config.
+SYNCED_TEXT_PROPERTIES = ("motd", "online-mode")
+SYNCED_NUMERIC_PROPERTIES = ("port", "max-players", "rcon.port")
 
 SUPPORTED_TUNNEL_PROVIDERS = ("ngrok", "playit")
 SUPPORTED_TUNNEL_PROTOCOLS = ("tcp", "udp")
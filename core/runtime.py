@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from core.server import ServerInstance
 
@@ -46,3 +47,17 @@ class RuntimeManager:
             for server_name in config.get("servers", {})
             if self.get_instance(server_name).is_running()
         ]
+
+    def stop_all(
+        self, server_names: list[str] | None = None, force: bool = False
+    ) -> dict[str, bool]:
+        """Stop servers in parallel so shutdown waits for the slowest, not the sum."""
+        names = self.running_servers() if server_names is None else server_names
+        if not names:
+            return {}
+        instances = [self.get_instance(server_name) for server_name in names]
+        with ThreadPoolExecutor(max_workers=len(instances)) as executor:
+            results = executor.map(
+                lambda instance: instance.stop(force=force), instances
+            )
+            return dict(zip(names, results))
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 
+import sqlite3
 import subprocess
 import threading
 import time
@@ -26,6 +27,8 @@ from core.constants import (
     SERVER_FLAVORS,
     SERVER_PROPERTIES_FILE,
     SESSION_FILE_NAME,
+    SYNCED_NUMERIC_PROPERTIES,
+    SYNCED_TEXT_PROPERTIES,
     TUNNEL_PID_FILE_NAME,
     TUNNEL_STATUS_BINARY_MISSING,
     TUNNEL_STATUS_FAILED,
@@ -64,6 +67,7 @@ from utils.system import (
     remove_file,
     run_command,
     screen_session_exists,
+    wait_for_pid_exit,
     wait_for_pid_file,
     write_text_file,
 )
@@ -140,12 +144,16 @@ class ServerInstance:
             raise RuntimeError(f"Server '{self.server_name}' is not configured.")
         return config, server_config
 
-    def get_server_port(self) -> int:
-        _config, server_config = self.refresh_config()
+    @staticmethod
+    def server_port_from_config(server_config: dict[str, Any]) -> int:
         flavor = server_config.get("server_flavor")
         default_port = SERVER_FLAVORS.get(flavor or "", {}).get("default_port", 25565)
         return int(server_config.get("server_settings", {}).get("port", default_port))
 
+    def get_server_port(self) -> int:
+        _config, server_config = self.refresh_config()
+        return self.server_port_from_config(server_config)
+
     def current_pid(self) -> int | None:
         pid = read_pid_file(self.pid_file)
         if pid and is_pid_running(pid):
@@ -169,10 +177,10 @@ class ServerInstance:
         return screen_session_exists(self.screen_name, logger=self.logger)
 
     def get_connection_info(self) -> dict[str, Any]:
-        port = self.get_server_port()
+        _config, server_config = self.refresh_config()
+        port = self.server_port_from_config(server_config)
         loopback_endpoint = f"127.0.0.1:{port}"
         lan_endpoints = [f"{address}:{port}" for address in get_local_ipv4_addresses()]
-        _config, server_config = self.refresh_config()
         tunnel_config = server_config.get("tunnel", {})
         tunnel_enabled = bool(tunnel_config.get("enabled"))
         tunnel_provider = tunnel_config.get("provider", "playit")
@@ -228,8 +236,6 @@ class ServerInstance:
         line_count: int = 3,
     ) -> str | None:
         log_path = self.get_tunnel_log_path(provider)
-        if not log_path.exists():
-            return None
         try:
             lines = log_path.read_text(encoding="utf-8", errors="replace").splitlines()
         except OSError:
@@ -341,10 +347,10 @@ class ServerInstance:
         def updater(config: dict[str, Any]) -> None:
             server_config = config["servers"][self.server_name]
             settings = server_config.setdefault("server_settings", {})
-            for key in ["motd", "online-mode"]:
+            for key in SYNCED_TEXT_PROPERTIES:
                 if key in properties:
                     settings[key] = str(properties[key])
-            for key in ["port", "max-players", "rcon.port"]:
+            for key in SYNCED_NUMERIC_PROPERTIES:
                 if key in properties:
                     try:
                         numeric = int(str(properties[key]))
@@ -497,20 +503,15 @@ class ServerInstance:
         pid = read_pid_file(self.tunnel_pid_file)
         if self.tunnel_process and self.tunnel_process.poll() is None:
             self.tunnel_process.terminate()
-            try:
-                self.tunnel_process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
+            if not wait_for_pid_exit(self.tunnel_process.pid, timeout=5):
                 self.tunnel_process.kill()
+            self.tunnel_process.poll()
         elif pid and is_pid_running(pid, expected_names=["playit", "ngrok"]):
             try:
                 proc = psutil.Process(pid)
                 proc.terminate()
-                proc.wait(timeout=5)
-            except psutil.TimeoutExpired:
-                try:
+                if not wait_for_pid_exit(pid, timeout=5):
                     proc.kill()
-                except psutil.Error:
-                    pass
             except psutil.Error:
                 pass
         remove_file(self.tunnel_pid_file)
@@ -674,11 +675,16 @@ class ServerInstance:
                 with process.oneshot():
                     cpu_usage = process.cpu_percent(interval=None)
                     ram_usage = process.memory_percent()
+            except psutil.Error:
+                break
+            try:
                 self.db_manager.log_performance_metric(
                     self.server_name, ram_usage, cpu_usage
                 )
-            except psutil.Error:
-                break
+            except sqlite3.Error as exc:
+                self.logger.log(
+                    "WARNING", f"Could not record metrics for {self.server_name}: {exc}"
+                )
         self.logger.log("INFO", f"Stopped monitoring {self.server_name}")
 
     def _backup_loop(self) -> None:
@@ -769,7 +775,7 @@ class ServerInstance:
         )
         protocol = tunnel_config.get("protocol", "tcp")
         local_host = tunnel_config.get("local_host", "127.0.0.1")
-        port = int(server_config.get("server_settings", {}).get("port", 25565))
+        port = self.server_port_from_config(server_config)
         local_port = tunnel_config.get("local_port") or port
         flavor = server_config.get("server_flavor")
 
@@ -3,23 +3,32 @@
 from __future__ import annotations
 
 import sqlite3
+import threading
+import weakref
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Iterator
 
 
+class _ThreadConnection:
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        # Runs when the owning thread exits and threading.local drops this holder.
+        self.close = weakref.finalize(self, conn.close)
+
+
 class DatabaseManager:
     """Thread-friendly database manager with WAL enabled."""
 
     def __init__(self, db_path: str | Path):
         self.db_path = Path(db_path)
+        self._local = threading.local()
         self._init_database()
 
     def _create_connection(self) -> sqlite3.Connection:
         conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
         conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA journal_mode=WAL;")
         conn.execute("PRAGMA synchronous=NORMAL;")
         conn.execute("PRAGMA foreign_keys=ON;")
         conn.execute("PRAGMA busy_timeout=30000;")
@@ -28,6 +37,7 @@ class DatabaseManager:
     def _init_database(self) -> None:
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         with self.get_connection() as conn:
+            conn.execute("PRAGMA journal_mode=WAL;")
             conn.executescript("""
                 CREATE TABLE IF NOT EXISTS server_sessions (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -80,14 +90,28 @@ class DatabaseManager:
                     ON error_log(timestamp);
                 """)
 
+    def _thread_connection(self) -> sqlite3.Connection:
+        holder = getattr(self._local, "holder", None)
+        if holder is None:
+            holder = _ThreadConnection(self._create_connection())
+            self._local.holder = holder
+        return holder.conn
+
     @contextmanager
     def get_connection(self) -> Iterator[sqlite3.Connection]:
-        conn = self._create_connection()
+        conn = self._thread_connection()
         try:
             yield conn
-            conn.commit()
-        finally:
-            conn.close()
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+
+    def close(self) -> None:
+        holder = getattr(self._local, "holder", None)
+        if holder is not None:
+            del self._local.holder
+            holder.close()
 
     def log_session_start(self, server_name: str, flavor: str, version: str) -> int:
         with self.get_connection() as conn:
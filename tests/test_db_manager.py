@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from typing import Iterator
+
+import pytest
+
+from db.manager import DatabaseManager
+
+
+@pytest.fixture(scope="module")
+def db(tmp_path_factory) -> Iterator[DatabaseManager]:
+    # Schema bootstrap is the expensive part, so share one database per module
+    # and keep tests independent by giving each its own server name.
+    manager = DatabaseManager(tmp_path_factory.mktemp("db") / "msm.db")
+    yield manager
+    manager.close()
+
+
+def test_session_lifecycle_updates_statistics(db: DatabaseManager):
+    session_id = db.log_session_start("lifecycle", "paper", "1.21")
+    assert db.get_last_open_session("lifecycle") == session_id
+
+    db.increment_crash_count(session_id)
+    db.increment_restart_count(session_id)
+    db.increment_restart_count(session_id)
+    db.log_session_end(session_id)
+
+    assert db.get_last_open_session("lifecycle") is None
+    stats = db.get_server_statistics("lifecycle")
+    assert stats["total_sessions"] == 1
+    assert stats["total_crashes"] == 1
+    assert stats["total_restarts"] == 2
+
+
+def test_open_sessions_are_scoped_per_server(db: DatabaseManager):
+    first = db.log_session_start("scoped-a", "vanilla", "1.20.6")
+    second = db.log_session_start("scoped-b", "fabric", "1.21")
+
+    assert db.get_last_open_session("scoped-a") == first
+    assert db.get_last_open_session("scoped-b") == second
+    assert db.get_last_open_session("scoped-missing") is None
+
+
+def test_backup_and_error_rows_are_recorded(db: DatabaseManager):
+    db.log_backup("records", "/tmp/records.zip", 1024)
+    db.log_error("records", "StartupError", "Java not found", severity="CRITICAL")
+
+    with db.get_connection() as conn:
+        backup = conn.execute(
+            "SELECT backup_size, backup_type FROM backup_history WHERE server_name = ?",
+            ("records",),
+        ).fetchone()
+        error = conn.execute(
+            "SELECT error_type, severity FROM error_log WHERE server_name = ?",
+            ("records",),
+        ).fetchone()
+
+    assert (backup["backup_size"], backup["backup_type"]) == (1024, "manual")
+    assert (error["error_type"], error["severity"]) == ("StartupError", "CRITICAL")
+
+
+def test_wal_mode_persists_for_new_connections(db: DatabaseManager):
+    with db.get_connection() as conn:
+        mode = conn.execute("PRAGMA journal_mode;").fetchone()[0]
+
+    assert mode == "wal"
+
+
+def test_connections_are_reused_per_thread_until_closed(tmp_path):
+    manager = DatabaseManager(tmp_path / "msm.db")
+    with manager.get_connection() as first, manager.get_connection() as second:
+        assert first is second
+
+    other: list = []
+    worker = threading.Thread(
+        target=lambda: other.append(manager.get_last_open_session("threads"))
+    )
+    worker.start()
+    worker.join()
+    assert other == [None]
+
+    manager.close()
+    manager.close()
+    with manager.get_connection() as reopened:
+        assert reopened is not first
+    manager.close()
+
+
+def test_exited_threads_release_their_connections(tmp_path, monkeypatch):
+    manager = DatabaseManager(tmp_path / "msm.db")
+    created: list[sqlite3.Connection] = []
+    create_connection = manager._create_connection
+
+    def tracking_create_connection():
+        conn = create_connection()
+        created.append(conn)
+        return conn
+
+    monkeypatch.setattr(manager, "_create_connection", tracking_create_connection)
+    for index in range(20):
+        worker = threading.Thread(
+            target=manager.log_backup, args=("threads", f"/tmp/{index}.zip", index)
+        )
+        worker.start()
+        worker.join()
+
+    assert len(created) == 20
+    for conn in created:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+    manager.close()
+
+
+def test_close_leaves_other_threads_connections_open(tmp_path):
+    manager = DatabaseManager(tmp_path / "msm.db")
+    ready = threading.Event()
+    release = threading.Event()
+    results: list = []
+
+    def monitor():
+        manager.get_last_open_session("monitor")
+        ready.set()
+        release.wait(5)
+        results.append(manager.get_last_open_session("monitor"))
+
+    worker = threading.Thread(target=monitor)
+    worker.start()
+    ready.wait(5)
+    manager.close()
+    release.set()
+    worker.join()
+
+    assert results == [None]
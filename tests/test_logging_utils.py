@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import logging
+
+from utils.logging_utils import EnhancedLogger
+
+
+def test_enhanced_logger_writes_to_its_own_named_logger(tmp_path, request):
+    name = f"MSM.test.{request.node.name}"
+    log_file = tmp_path / "msm.log"
+    logger = EnhancedLogger(log_file, max_size=1024, retention_days=1, name=name)
+
+    logger.log("WARNING", "Disk almost full", free_mb=12)
+
+    assert logger.logger is logging.getLogger(name)
+    assert not set(logger.logger.handlers) & set(logging.getLogger("MSM").handlers)
+    assert "Disk almost full | {'free_mb': 12}" in log_file.read_text(encoding="utf-8")
+
+
+def test_enhanced_logger_rotates_oversized_log(tmp_path, request):
+    log_file = tmp_path / "msm.log"
+    log_file.write_text("x" * 64, encoding="utf-8")
+
+    EnhancedLogger(
+        log_file, max_size=16, retention_days=1, name=f"MSM.test.{request.node.name}"
+    )
+
+    assert list(tmp_path.glob("msm.log.*"))
+
+
+def test_enhanced_logger_writes_records_immediately(tmp_path, request):
+    log_file = tmp_path / "msm.log"
+    logger = EnhancedLogger(
+        log_file, max_size=1024, retention_days=1, name=f"MSM.test.{request.node.name}"
+    )
+
+    logger.log("INFO", "Server started")
+    assert "Server started" in log_file.read_text(encoding="utf-8")
+
+    logger.log("WARNING", "Server exited unexpectedly. Restarting soon.")
+    assert "Restarting soon." in log_file.read_text(encoding="utf-8")
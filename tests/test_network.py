@@ -1,5 +1,13 @@
 from __future__ import annotations
 
+import hashlib
+import io
+import json
+import urllib.error
+import zipfile
+
+import pytest
+
 from utils import network
 
 
@@ -94,20 +102,162 @@ def test_get_vanilla_versions_filters_snapshots(monkeypatch):
     assert versions["1.20.6"]["url"] == "https://example/release.json"
 
 
-def test_is_snapshot_version():
-    from utils.network import is_snapshot_version
-
-    # Release candidates
-    assert is_snapshot_version("1.21.11-rc3") is True
-    assert is_snapshot_version("1.21-rc1") is True
-    # Pre-releases
-    assert is_snapshot_version("1.20-pre1") is True
-    # Weekly snapshots
-    assert is_snapshot_version("24w14a") is True
-    assert is_snapshot_version("12w30a") is True
-    # Named snapshots
-    assert is_snapshot_version("1.14-snapshot-2") is True
-    # Stable releases
-    assert is_snapshot_version("1.20.6") is False
-    assert is_snapshot_version("1.21") is False
-    assert is_snapshot_version("1.8.8") is False
+@pytest.mark.parametrize(
+    ("version", "expected"),
+    [
+        # Release candidates
+        ("1.21.11-rc3", True),
+        ("1.21-rc1", True),
+        # Pre-releases
+        ("1.20-pre1", True),
+        # Weekly snapshots
+        ("24w14a", True),
+        ("12w30a", True),
+        # Named snapshots
+        ("1.14-snapshot-2", True),
+        # Stable releases
+        ("1.20.6", False),
+        ("1.21", False),
+        ("1.8.8", False),
+    ],
+)
+def test_is_snapshot_version(version, expected):
+    assert network.is_snapshot_version(version) is expected
+
+
+def test_get_fabric_versions_combines_meta_endpoints(monkeypatch):
+    def fake_request(_session, _method, url, logger=None, **kwargs):
+        if url.endswith("/game"):
+            return DummyResponse(
+                [
+                    {"version": "1.21", "stable": True},
+                    {"version": "24w14a", "stable": False},
+                ]
+            )
+        if url.endswith("/loader"):
+            return DummyResponse([{"version": "0.15.11"}])
+        if url.endswith("/installer"):
+            return DummyResponse([{"version": "1.0.1"}])
+        raise AssertionError(f"Unexpected URL: {url}")
+
+    monkeypatch.setattr(network, "create_robust_session", DummySession)
+    monkeypatch.setattr(network, "safe_request", fake_request)
+
+    versions = network.get_fabric_versions("fabric")
+
+    assert versions == {
+        "1.21": {"loader": "0.15.11", "installer": "1.0.1", "is_snapshot": False}
+    }
+
+
+class DummyUrlopenResponse:
+    def __init__(self, payload):
+        self._body = json.dumps(payload).encode("utf-8")
+
+    def read(self):
+        return self._body
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        return None
+
+
+def test_get_ngrok_public_url_matches_local_port(monkeypatch):
+    payload = {
+        "tunnels": [
+            {"config": {"addr": "localhost:8080"}, "public_url": "tcp://other:1"},
+            {
+                "config": {"addr": "localhost:25565"},
+                "public_url": "tcp://0.tcp.ngrok.io:12345",
+            },
+        ]
+    }
+
+    def fake_urlopen(url, timeout=None):
+        assert url == network.NGROK_API_URL
+        return DummyUrlopenResponse(payload)
+
+    monkeypatch.setattr(network.urllib.request, "urlopen", fake_urlopen)
+
+    assert network.get_ngrok_public_url(25565) == "tcp://0.tcp.ngrok.io:12345"
+
+
+def test_get_ngrok_public_url_returns_none_when_agent_is_down(monkeypatch):
+    def fake_urlopen(url, timeout=None):
+        raise urllib.error.URLError("connection refused")
+
+    monkeypatch.setattr(network.urllib.request, "urlopen", fake_urlopen)
+
+    assert network.get_ngrok_public_url(25565) is None
+
+
+class DummyDownloadResponse:
+    status_code = 200
+
+    def __init__(self, body: bytes):
+        self._body = body
+
+    def iter_content(self, chunk_size):
+        midpoint = len(self._body) // 2
+        yield self._body[:midpoint]
+        yield self._body[midpoint:]
+
+
+def _patch_download(monkeypatch, body: bytes):
+    monkeypatch.setattr(network, "create_robust_session", DummySession)
+    monkeypatch.setattr(
+        network, "safe_request", lambda *args, **kwargs: DummyDownloadResponse(body)
+    )
+
+
+def _jar_bytes() -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("META-INF/MANIFEST.MF", "Manifest-Version: 1.0\n")
+    return buffer.getvalue()
+
+
+def test_download_server_binary_verifies_sha256(monkeypatch, tmp_path):
+    body = _jar_bytes()
+    _patch_download(monkeypatch, body)
+    version_info = {
+        "latest_build": 1,
+        "download_name": "paper-1.21-1.jar",
+        "sha256": hashlib.sha256(body).hexdigest(),
+    }
+
+    artifact = network.download_server_binary("paper", "1.21", version_info, tmp_path)
+
+    assert artifact.read_bytes() == body
+    assert not (tmp_path / "server.jar.part").exists()
+
+
+def test_download_server_binary_keeps_old_jar_on_checksum_mismatch(
+    monkeypatch, tmp_path
+):
+    (tmp_path / "server.jar").write_bytes(b"working jar")
+    _patch_download(monkeypatch, b"truncated")
+    version_info = {
+        "latest_build": 1,
+        "download_name": "paper-1.21-1.jar",
+        "sha256": hashlib.sha256(_jar_bytes()).hexdigest(),
+    }
+
+    with pytest.raises(RuntimeError, match="Checksum mismatch"):
+        network.download_server_binary("paper", "1.21", version_info, tmp_path)
+
+    assert (tmp_path / "server.jar").read_bytes() == b"working jar"
+    assert not (tmp_path / "server.jar.part").exists()
+
+
+def test_download_server_binary_rejects_truncated_jar(monkeypatch, tmp_path):
+    (tmp_path / "server.jar").write_bytes(b"working jar")
+    _patch_download(monkeypatch, _jar_bytes()[:-10])
+    version_info = {"download_url": "https://example.invalid/purpur.jar"}
+
+    with pytest.raises(RuntimeError, match="not a valid jar"):
+        network.download_server_binary("purpur", "1.21", version_info, tmp_path)
+
+    assert (tmp_path / "server.jar").read_bytes() == b"working jar"
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-
+import io
+import json
+import shutil
+import urllib.error
 from unittest.mock import patch
 
 import pytest
@@ -10,7 +13,9 @@ import pytest
 from core.constants import (
     TUNNEL_STATUS_BINARY_MISSING,
     TUNNEL_STATUS_NOT_RUNNING,
+    TUNNEL_STATUS_READY,
 )
+from utils import network, ngrok, system
 from utils.ngrok import (
     diagnose_ngrok,
     get_saved_ngrok_endpoint,
@@ -27,14 +32,14 @@ def tmp_server_dir(tmp_path):
 
 
 def test_resolve_ngrok_binary_returns_none_when_nothing_found():
-    with patch("shutil.which", return_value=None):
+    with patch.object(shutil, "which", return_value=None):
         assert resolve_ngrok_binary("nonexistent") is None
 
 
 def test_resolve_ngrok_binary_custom_path(tmp_path):
     fake_bin = tmp_path / "custom-ngrok"
     fake_bin.write_text("#!/bin/sh\necho ok")
-    with patch("shutil.which", return_value=str(fake_bin)):
+    with patch.object(shutil, "which", return_value=str(fake_bin)):
         result = resolve_ngrok_binary(str(fake_bin))
     assert result == str(fake_bin)
 
@@ -45,6 +50,22 @@ def test_save_and_get_ngrok_endpoint(tmp_server_dir):
     assert get_saved_ngrok_endpoint(tmp_server_dir) == "tcp://0.tcp.ngrok.io:12345"
 
 
+def test_save_ngrok_endpoint_skips_unchanged_value(tmp_server_dir, monkeypatch):
+    writes: list[str] = []
+    original_write = system.write_text_file
+
+    def recording_write(path, value):
+        writes.append(value)
+        original_write(path, value)
+
+    monkeypatch.setattr(system, "write_text_file", recording_write)
+    save_ngrok_endpoint(tmp_server_dir, "tcp://0.tcp.ngrok.io:12345")
+    save_ngrok_endpoint(tmp_server_dir, "tcp://0.tcp.ngrok.io:12345")
+    save_ngrok_endpoint(tmp_server_dir, "tcp://1.tcp.ngrok.io:54321")
+
+    assert writes == ["tcp://0.tcp.ngrok.io:12345", "tcp://1.tcp.ngrok.io:54321"]
+
+
 def test_inspect_ngrok_status_not_running(tmp_server_dir):
     status = inspect_ngrok_status(tmp_server_dir, 25565)
     assert status.provider == "ngrok"
@@ -61,14 +82,95 @@ def test_inspect_ngrok_status_with_saved_endpoint(tmp_server_dir):
 
 
 def test_start_ngrok_agent_missing_binary(tmp_server_dir):
-    with patch("utils.ngrok.resolve_ngrok_binary", return_value=None):
+    with patch.object(ngrok, "resolve_ngrok_binary", autospec=True, return_value=None):
         status, _ = start_ngrok_agent(tmp_server_dir, "nonexistent", 25565, None)
     assert status.state == TUNNEL_STATUS_BINARY_MISSING
 
 
+def test_start_ngrok_agent_returns_as_soon_as_url_is_ready(tmp_server_dir, monkeypatch):
+    class FakeProcess:
+        pid = 4242
+
+        def poll(self):
+            return None
+
+    monkeypatch.setattr(
+        ngrok.subprocess, "Popen", lambda *args, **kwargs: FakeProcess()
+    )
+    monkeypatch.setattr(ngrok.time, "sleep", lambda _: pytest.fail("should not sleep"))
+    with patch.object(
+        ngrok, "resolve_ngrok_binary", autospec=True, return_value="ngrok"
+    ), patch.object(
+        ngrok,
+        "get_ngrok_public_url",
+        autospec=True,
+        return_value="tcp://0.tcp.ngrok.io:1",
+    ):
+        status, log_handle = start_ngrok_agent(tmp_server_dir, "ngrok", 25565, None)
+    log_handle.close()
+    assert status.state == TUNNEL_STATUS_READY
+    assert status.endpoint == "tcp://0.tcp.ngrok.io:1"
+
+
+def test_start_ngrok_agent_does_not_warn_while_api_starts(tmp_server_dir, monkeypatch):
+    class FakeProcess:
+        pid = 4242
+
+        def poll(self):
+            return None
+
+    class FakeResponse(io.BytesIO):
+        def __enter__(self):
+            return self
+
+    class RecordingLogger:
+        def __init__(self):
+            self.records: list[tuple[str, str]] = []
+
+        def log(self, level, message, **_kwargs):
+            self.records.append((level, message))
+
+    payload = {
+        "tunnels": [
+            {
+                "config": {"addr": "localhost:25565"},
+                "public_url": "tcp://0.tcp.ngrok.io:1",
+            }
+        ]
+    }
+    responses = iter(
+        [
+            urllib.error.URLError(ConnectionRefusedError(111, "Connection refused")),
+            urllib.error.URLError(ConnectionRefusedError(111, "Connection refused")),
+            FakeResponse(json.dumps(payload).encode()),
+        ]
+    )
+
+    def fake_urlopen(url, timeout=None):
+        response = next(responses)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    logger = RecordingLogger()
+    monkeypatch.setattr(
+        ngrok.subprocess, "Popen", lambda *args, **kwargs: FakeProcess()
+    )
+    monkeypatch.setattr(ngrok.time, "sleep", lambda _: None)
+    monkeypatch.setattr(network.urllib.request, "urlopen", fake_urlopen)
+    with patch.object(
+        ngrok, "resolve_ngrok_binary", autospec=True, return_value="ngrok"
+    ):
+        status, log_handle = start_ngrok_agent(tmp_server_dir, "ngrok", 25565, logger)
+    log_handle.close()
+
+    assert status.state == TUNNEL_STATUS_READY
+    assert [record for record in logger.records if record[0] == "WARNING"] == []
+
+
 def test_diagnose_ngrok_binary_missing(tmp_server_dir):
     config = {"binary_path": "nonexistent", "protocol": "tcp"}
-    with patch("utils.ngrok.resolve_ngrok_binary", return_value=None):
+    with patch.object(ngrok, "resolve_ngrok_binary", autospec=True, return_value=None):
         checks = diagnose_ngrok(tmp_server_dir, config, 25565)
     binary_check = next(c for c in checks if c.name == "Ngrok binary")
     assert binary_check.ok is False
@@ -76,7 +178,9 @@ def test_diagnose_ngrok_binary_missing(tmp_server_dir):
 
 def test_diagnose_ngrok_wrong_protocol(tmp_server_dir):
     config = {"binary_path": "ngrok", "protocol": "udp"}
-    with patch("utils.ngrok.resolve_ngrok_binary", return_value="/usr/bin/ngrok"):
+    with patch.object(
+        ngrok, "resolve_ngrok_binary", autospec=True, return_value="/usr/bin/ngrok"
+    ):
         checks = diagnose_ngrok(tmp_server_dir, config, 25565)
     proto_check = next(c for c in checks if c.name == "Protocol")
     assert proto_check.ok is False
@@ -85,7 +189,9 @@ def test_diagnose_ngrok_wrong_protocol(tmp_server_dir):
 
 def test_diagnose_ngrok_pocketmine_incompatible(tmp_server_dir):
     config = {"binary_path": "ngrok", "protocol": "tcp"}
-    with patch("utils.ngrok.resolve_ngrok_binary", return_value="/usr/bin/ngrok"):
+    with patch.object(
+        ngrok, "resolve_ngrok_binary", autospec=True, return_value="/usr/bin/ngrok"
+    ):
         checks = diagnose_ngrok(
             tmp_server_dir, config, 19132, server_flavor="pocketmine"
         )
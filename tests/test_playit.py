@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-
+import shutil
 from unittest.mock import patch
 
 import pytest
@@ -13,6 +13,7 @@ from core.constants import (
     TUNNEL_STATUS_NOT_RUNNING,
     TUNNEL_STATUS_SECRET_MISSING,
 )
+from utils import playit
 from utils.playit import (
     build_playit_mapping_hint,
     diagnose_playit,
@@ -30,14 +31,14 @@ def tmp_server_dir(tmp_path):
 
 
 def test_resolve_playit_binary_returns_none_when_nothing_found():
-    with patch("shutil.which", return_value=None):
+    with patch.object(shutil, "which", return_value=None):
         assert resolve_playit_binary("nonexistent") is None
 
 
 def test_resolve_playit_binary_custom_path_takes_priority(tmp_path):
     fake_bin = tmp_path / "custom-playit"
     fake_bin.write_text("#!/bin/sh\necho ok")
-    with patch("shutil.which", return_value=str(fake_bin)):
+    with patch.object(shutil, "which", return_value=str(fake_bin)):
         result = resolve_playit_binary(str(fake_bin))
     assert result == str(fake_bin)
 
@@ -66,14 +67,18 @@ def test_inspect_playit_status_with_saved_endpoint(tmp_server_dir):
 def test_start_playit_agent_missing_binary(tmp_server_dir):
     secret = tmp_server_dir / PLAYIT_SECRET_FILE_NAME
     secret.write_text("secret-data")
-    with patch("utils.playit.resolve_playit_binary", return_value=None):
+    with patch.object(
+        playit, "resolve_playit_binary", autospec=True, return_value=None
+    ):
         status, _ = start_playit_agent(tmp_server_dir, "nonexistent", secret, None)
     assert status.state == TUNNEL_STATUS_BINARY_MISSING
 
 
 def test_start_playit_agent_missing_secret(tmp_server_dir):
     secret = tmp_server_dir / PLAYIT_SECRET_FILE_NAME
-    with patch("utils.playit.resolve_playit_binary", return_value="/usr/bin/playit"):
+    with patch.object(
+        playit, "resolve_playit_binary", autospec=True, return_value="/usr/bin/playit"
+    ):
         status, _ = start_playit_agent(tmp_server_dir, "playit", secret, None)
     assert status.state == TUNNEL_STATUS_SECRET_MISSING
 
@@ -87,7 +92,9 @@ def test_build_playit_mapping_hint_formats_correctly():
 
 def test_diagnose_playit_binary_missing(tmp_server_dir):
     config = {"binary_path": "nonexistent", "protocol": "tcp"}
-    with patch("utils.playit.resolve_playit_binary", return_value=None):
+    with patch.object(
+        playit, "resolve_playit_binary", autospec=True, return_value=None
+    ):
         checks = diagnose_playit(tmp_server_dir, config, 25565)
     binary_check = next(c for c in checks if c.name == "Playit binary")
     assert binary_check.ok is False
@@ -95,7 +102,9 @@ def test_diagnose_playit_binary_missing(tmp_server_dir):
 
 def test_diagnose_playit_pocketmine_wrong_protocol(tmp_server_dir):
     config = {"binary_path": "playit", "protocol": "tcp"}
-    with patch("utils.playit.resolve_playit_binary", return_value="/usr/bin/playit"):
+    with patch.object(
+        playit, "resolve_playit_binary", autospec=True, return_value="/usr/bin/playit"
+    ):
         checks = diagnose_playit(
             tmp_server_dir, config, 19132, server_flavor="pocketmine"
         )
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from utils.properties import load_properties, write_properties
+
+
+def test_load_properties_last_duplicate_wins(tmp_path):
+    properties_path = tmp_path / "server.properties"
+    properties_path.write_text(
+        "#level-name=commented\n"
+        "level-name=first\n"
+        "level-name-suffix=other\n"
+        "level-name = second\n",
+        encoding="utf-8",
+    )
+
+    properties = load_properties(properties_path)
+    assert properties["level-name"] == "second"
+    assert properties["level-name-suffix"] == "other"
+
+
+def test_load_properties_returns_empty_for_missing_file(tmp_path):
+    assert load_properties(tmp_path / "eula.txt").get("eula", "false") == "false"
+
+
+def test_load_properties_returns_fresh_copy_after_write(tmp_path):
+    properties_path = tmp_path / "server.properties"
+    write_properties(properties_path, {"motd": "first"})
+
+    loaded = load_properties(properties_path)
+    loaded["motd"] = "mutated"
+    assert load_properties(properties_path) == {"motd": "first"}
+
+    write_properties(properties_path, {"motd": "second"})
+    assert load_properties(properties_path) == {"motd": "second"}
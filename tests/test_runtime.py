@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import threading
+
+from core import runtime
+
+
+class FakeConfigManager:
+    def load(self):
+        return {"servers": {"alpha": {}, "beta": {}}}
+
+
+def test_stop_all_stops_servers_concurrently(monkeypatch):
+    # Both stops must be in flight together to get past the barrier.
+    barrier = threading.Barrier(2, timeout=5)
+
+    class FakeInstance:
+        def __init__(self, server_name, *_args):
+            self.server_name = server_name
+
+        def is_running(self):
+            return True
+
+        def resume_background_services(self):
+            return None
+
+        def stop(self, force=False):
+            barrier.wait()
+            return not force
+
+    monkeypatch.setattr(runtime, "ServerInstance", FakeInstance)
+    manager = runtime.RuntimeManager(FakeConfigManager(), None, None)
+
+    assert manager.stop_all() == {"alpha": True, "beta": True}
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import importlib
-import shutil
 import zipfile
 from pathlib import Path
 
@@ -9,29 +8,39 @@ import pytest
 
 import core.constants as constants
 from utils.archive import safe_extract_zip
-from utils.system import get_required_java
-
-
-def test_safe_extract_zip_blocks_path_traversal():
-    temp_path = Path(".test_tmp") / "zip-slip"
-    if temp_path.exists():
-        shutil.rmtree(temp_path, ignore_errors=True)
-    temp_path.mkdir(parents=True, exist_ok=True)
-    try:
-        archive_path = temp_path / "bad.zip"
-        with zipfile.ZipFile(archive_path, "w") as archive:
-            archive.writestr("../escape.txt", "owned")
-
-        with pytest.raises(ValueError, match="Blocked unsafe archive member"):
-            safe_extract_zip(archive_path, temp_path / "server")
-    finally:
-        shutil.rmtree(temp_path, ignore_errors=True)
-
-
-def test_get_required_java_handles_1_20_5_and_older_releases():
-    assert get_required_java("1.20.5") == "21"
-    assert get_required_java("1.20.4") == "17"
-    assert get_required_java("1.16.5") == "8"
+from utils.system import _parse_java_version, get_required_java
+
+
+def test_safe_extract_zip_blocks_path_traversal(tmp_path: Path):
+    archive_path = tmp_path / "bad.zip"
+    with zipfile.ZipFile(archive_path, "w") as archive:
+        archive.writestr("../escape.txt", "owned")
+
+    with pytest.raises(ValueError, match="Blocked unsafe archive member"):
+        safe_extract_zip(archive_path, tmp_path / "server")
+
+
+@pytest.mark.parametrize(
+    ("version", "expected"),
+    [("1.20.5", "21"), ("1.20.4", "17"), ("1.16.5", "8")],
+)
+def test_get_required_java_handles_1_20_5_and_older_releases(version, expected):
+    assert get_required_java(version) == expected
+
+
+@pytest.mark.parametrize(
+    ("output", "expected"),
+    [
+        ('openjdk version "17.0.9" 2023-10-17\nOpenJDK Runtime Environment', "17"),
+        ('java version "1.8.0_392"\nJava(TM) SE Runtime Environment', "8"),
+        ('openjdk version "21" 2023-09-19', "21"),
+        ('openjdk version "22-ea" 2024-03-19', "22"),
+        ('Picked up _JAVA_OPTIONS: "-Xmx1g"\nopenjdk version "11.0.2"', "11"),
+        ("Error: could not find libjava.so", None),
+    ],
+)
+def test_parse_java_version(output, expected):
+    assert _parse_java_version(output) == expected
 
 
 def test_common_java_home_bases_skips_empty_java_home(monkeypatch: pytest.MonkeyPatch):
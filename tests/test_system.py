@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import socket
+import subprocess
+import sys
+
+import pytest
+
+from core.constants import SCREEN_SESSION_PATTERN
+from utils import system
+
+
+def test_local_ipv4_addresses_are_cached_until_route_changes(monkeypatch, tmp_path):
+    route_file = tmp_path / "route"
+    route_file.write_text(
+        "Iface\tDestination\tGateway\nwlan0\t00000000\t0101A8C0\n",
+        encoding="utf-8",
+    )
+    calls: list[int] = []
+
+    def fake_collect():
+        calls.append(1)
+        return ["192.168.1.20"]
+
+    monkeypatch.setattr(system, "DEFAULT_ROUTE_FILE", route_file)
+    monkeypatch.setattr(system, "_collect_local_ipv4_addresses", fake_collect)
+    monkeypatch.setattr(system, "_LAN_ADDRESS_CACHE", {})
+
+    assert system.get_local_ipv4_addresses() == ["192.168.1.20"]
+    assert system.get_local_ipv4_addresses() == ["192.168.1.20"]
+    assert len(calls) == 1
+
+    route_file.write_text(
+        "Iface\tDestination\tGateway\nrmnet0\t00000000\t01000A0A\n",
+        encoding="utf-8",
+    )
+    system.get_local_ipv4_addresses()
+    assert len(calls) == 2
+
+
+def test_screen_session_exists_scans_proc_cmdlines(monkeypatch, tmp_path):
+    for pid, argv in {
+        "101": b"SCREEN\0-dmS\0mc_survival\0sh\0-c\0exec java\0",
+        "102": b"bash\0mc_creative\0",
+        "103": b"/usr/bin/screen\0-U\0-S\0mc_lobby\0",
+        "104": b"SCREEN\0-dmS\0mc_survival_old\0sh\0",
+        "self": b"python\0",
+    }.items():
+        (tmp_path / pid).mkdir()
+        (tmp_path / pid / "cmdline").write_bytes(argv)
+
+    def fail_run_command(*_args, **_kwargs):
+        raise AssertionError("screen -ls should not be spawned")
+
+    monkeypatch.setattr(system, "PROC_DIR", tmp_path)
+    monkeypatch.setattr(system, "run_command", fail_run_command)
+
+    assert system.screen_session_exists("mc_survival") is True
+    assert system.screen_session_exists("mc_lobby") is True
+    assert system.screen_session_exists("mc_creative") is False
+    assert system.screen_session_exists("mc_survival_ol") is False
+
+
+@pytest.mark.parametrize(
+    ("cmdline", "expected"),
+    [
+        (b"screen\0-ls\0mc_a\0", []),
+        (b"screen\0-S\0mc_a\0-X\0quit\0", []),
+        (b"screen\0-S\0mc_a\0-p\0000\0-X\0stuff\0say hi\r\0", []),
+        (b"SCREEN\0-s\0/bin/bash\0-dmS\0mc_a\0", [b"mc_a"]),
+    ],
+)
+def test_screen_session_pattern_skips_clients(cmdline, expected):
+    assert SCREEN_SESSION_PATTERN.findall(cmdline) == expected
+
+
+def test_probe_tcp_ports_reports_open_and_closed_ports():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as listener:
+        listener.bind(("127.0.0.1", 0))
+        listener.listen()
+        open_port = listener.getsockname()[1]
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as spare:
+            spare.bind(("127.0.0.1", 0))
+            closed_port = spare.getsockname()[1]
+
+        results = system.probe_tcp_ports(
+            [("127.0.0.1", open_port), ("127.0.0.1", closed_port)], timeout=1
+        )
+
+    assert results == {
+        ("127.0.0.1", open_port): True,
+        ("127.0.0.1", closed_port): False,
+    }
+    assert system.is_tcp_port_open("127.0.0.1", closed_port, timeout=1) is False
+
+
+def test_local_addresses_rank_lan_before_cgnat(monkeypatch):
+    class FakeAddress:
+        family = socket.AF_INET
+
+        def __init__(self, address):
+            self.address = address
+
+    def fail_probe(*_args, **_kwargs):
+        raise OSError("offline")
+
+    monkeypatch.setattr(system.socket, "socket", fail_probe)
+    monkeypatch.setattr(
+        system.psutil,
+        "net_if_addrs",
+        lambda: {
+            "lo": [FakeAddress("127.0.0.1")],
+            "rmnet0": [FakeAddress("100.72.14.3")],
+            "eth0": [FakeAddress("81.2.69.142")],
+            "wlan0": [FakeAddress("172.20.10.2")],
+        },
+    )
+
+    assert system._collect_local_ipv4_addresses() == [
+        "172.20.10.2",
+        "100.72.14.3",
+        "81.2.69.142",
+    ]
+
+
+def test_wait_for_pid_exit_times_out_then_sees_exit():
+    proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    try:
+        assert system.wait_for_pid_exit(proc.pid, timeout=0.05) is False
+        proc.terminate()
+        assert system.wait_for_pid_exit(proc.pid, timeout=5) is True
+    finally:
+        proc.kill()
+        proc.wait()
+
+
+def test_detect_java_version_is_cached_until_binary_changes(monkeypatch, tmp_path):
+    java_binary = tmp_path / "java"
+    java_binary.write_text("stub", encoding="utf-8")
+    calls: list[list[str]] = []
+
+    def fake_run_command(command, **kwargs):
+        calls.append(command)
+        return subprocess.CompletedProcess(
+            command, 0, stdout="", stderr='openjdk version "17.0.9" 2023-10-17'
+        )
+
+    monkeypatch.setattr(system, "run_command", fake_run_command)
+    monkeypatch.setattr(system, "_JAVA_VERSION_CACHE", {})
+
+    assert system.detect_java_version(str(java_binary)) == "17"
+    assert system.detect_java_version(str(java_binary)) == "17"
+    assert len(calls) == 1
+
+    java_binary.write_text("upgraded stub", encoding="utf-8")
+    assert system.detect_java_version(str(java_binary)) == "17"
+    assert len(calls) == 2
@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import shutil
 import subprocess
+import sys
 import threading
 import time
+from collections.abc import Sequence
 from pathlib import Path
 
 from core.config import ConfigManager
@@ -30,7 +32,7 @@ from ui.colors import C
 from utils.logging_utils import EnhancedLogger
 from utils.network import download_ngrok_binary, get_versions_for_flavor
 from utils.ngrok import diagnose_ngrok
-from utils.playit import diagnose_playit
+from utils.playit import diagnose_playit, resolve_playit_binary
 from utils.playit_api import (
     PLAYIT_THIRD_PARTY_AUTH_URL,
     PlayitApiClient,
@@ -58,6 +60,73 @@ from utils.tunnels import (
     extract_playit_claim_url,
 )
 
+# Called as diagnose(server_dir, tunnel_config, port, flavor, logger).
+TUNNEL_DIAGNOSTICS = {
+    "playit": lambda server_dir, tunnel_config, port, flavor, _logger: (
+        diagnose_playit(server_dir, tunnel_config, port, flavor)
+    ),
+    "ngrok": diagnose_ngrok,
+}
+
+# Static wizard help text, kept free of color codes so disable_colors() still applies.
+NGROK_REQUIREMENTS = (
+    "Ngrok requirements:",
+    " - The ngrok agent must be installed and reachable by MSM.",
+    " - Your ngrok account must be configured with an authtoken.",
+    " - TCP endpoints may require billing details on ngrok.",
+)
+PLAYIT_NOTES = (
+    "Playit notes:",
+    " - MSM uses `claim generate`, `claim url`, and `claim exchange` for setup.",
+    " - MSM uses the playit agent for the managed background session.",
+    " - MSM can create or update the Playit tunnel after the agent is linked.",
+    " - Playit account approval happens in your browser with a one-time code.",
+)
+PLAYIT_TERMUX_INSTALL = (
+    "\nInstall playit on Termux:",
+    " pkg update && pkg upgrade",
+    " pkg install tur-repo playit",
+    " MSM does not need tmux when it manages playit for this server.",
+)
+
+MAIN_MENU = (
+    " 1. Start server",
+    " 2. Stop server",
+    " 3. Install or update server",
+    " 4. Configure server",
+    " 5. Edit server.properties and eula.txt",
+    " 6. Attach to console",
+    " 7. World manager",
+    " 8. Send command",
+    " 9. Statistics",
+    "10. Create new server",
+    "11. Switch server",
+    " 0. Exit",
+)
+TUNNEL_WIZARD_MENU = (
+    " 1. Setup ngrok",
+    " 2. Setup playit",
+    " 3. Diagnostics (current provider)",
+    " 4. Playit diagnostics",
+    " 5. Ngrok diagnostics",
+    " 6. Disable tunnel for this server",
+    " 0. Back",
+)
+SERVER_FILE_EDITOR_MENU = (
+    "\n 1. Show current properties",
+    " 2. Set or update a property",
+    " 3. Delete a property",
+    " 4. Toggle EULA",
+    " 0. Back",
+)
+WORLD_MANAGER_MENU = (
+    " 1. Create backup",
+    " 2. List backups",
+    " 3. Restore backup",
+    " 4. Delete backup",
+    " 0. Back",
+)
+
 
 def pause() -> None:
     input("\nPress Enter to continue...")
@@ -67,6 +136,11 @@ def clear_screen() -> None:
     print("\033[H\033[2J", end="", flush=True)
 
 
+def emit_lines(lines: Sequence[str]) -> None:
+    """Write a block of lines with a single stdout write."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
 def format_duration(seconds: float | int | None) -> str:
     if not seconds:
         return "N/A"
@@ -126,16 +200,17 @@ def print_header(current_server: str | None, runtime: RuntimeManager) -> None:
     running_servers = runtime.running_servers()
     ram_usage = f"{system_info['available_ram_mb']}MB/{system_info['total_ram_mb']}MB"
     cpu_info = f"{system_info['cpu_count']} cores @ {system_info['cpu_usage']:.1f}%"
-    print(f"{C.BOLD}{C.CYAN}{'=' * 72}{C.RESET}")
-    print(f"{C.BOLD}{C.CYAN}Minecraft Server Manager v{VERSION}{C.RESET}")
-    print(
+    lines = [
+        f"{C.BOLD}{C.CYAN}{'=' * 72}{C.RESET}",
+        f"{C.BOLD}{C.CYAN}Minecraft Server Manager v{VERSION}{C.RESET}",
         f"{C.DIM}RAM: {ram_usage} | CPU: {cpu_info} "
-        f"| Platform: {system_info['platform']}{C.RESET}"
-    )
-    print(f"{C.DIM}Running servers: {len(running_servers)}{C.RESET}")
+        f"| Platform: {system_info['platform']}{C.RESET}",
+        f"{C.DIM}Running servers: {len(running_servers)}{C.RESET}",
+    ]
     if current_server:
-        print(f"{C.DIM}Current server: {current_server}{C.RESET}")
-    print(f"{C.BOLD}{C.CYAN}{'=' * 72}{C.RESET}\n")
+        lines.append(f"{C.DIM}Current server: {current_server}{C.RESET}")
+    lines.append(f"{C.BOLD}{C.CYAN}{'=' * 72}{C.RESET}\n")
+    emit_lines(lines)
 
 
 def print_connection_summary(instance) -> None:
@@ -150,11 +225,14 @@ def print_connection_summary(instance) -> None:
 
     tunnel_display = info["tunnel_url"] or info["tunnel_status"]
 
-    print(f"{C.DIM}Localhost: {info['loopback_endpoint']}{C.RESET}")
-    print(f"{C.DIM}LAN/Wi-Fi: {lan_display}{C.RESET}")
-    print(f"{C.DIM}Tunnel: {tunnel_display}{C.RESET}")
+    lines = [
+        f"{C.DIM}Localhost: {info['loopback_endpoint']}{C.RESET}",
+        f"{C.DIM}LAN/Wi-Fi: {lan_display}{C.RESET}",
+        f"{C.DIM}Tunnel: {tunnel_display}{C.RESET}",
+    ]
     if info.get("tunnel_setup_url"):
-        print(f"{C.DIM}Tunnel setup: {info['tunnel_setup_url']}{C.RESET}")
+        lines.append(f"{C.DIM}Tunnel setup: {info['tunnel_setup_url']}{C.RESET}")
+    emit_lines(lines)
 
 
 def resolve_tunnel_binary(binary_path: str) -> str | None:
@@ -310,7 +388,7 @@ def tunnel_diagnostics_screen(
     server_config = config["servers"][current_server]
     tunnel_config = server_config.get("tunnel", {})
     selected = provider or tunnel_config.get("provider", "playit")
-    server_port = int(server_config.get("server_settings", {}).get("port", 25565))
+    server_port = instance.server_port_from_config(server_config)
     flavor = server_config.get("server_flavor")
 
     print_header(current_server, runtime)
@@ -318,18 +396,12 @@ def tunnel_diagnostics_screen(
     print_connection_summary(instance)
     print()
 
-    if selected == "playit":
-        checks = diagnose_playit(
-            instance.server_dir, tunnel_config, server_port, flavor
-        )
-    elif selected == "ngrok":
-        checks = diagnose_ngrok(
-            instance.server_dir, tunnel_config, server_port, flavor, logger
-        )
-    else:
+    diagnose = TUNNEL_DIAGNOSTICS.get(selected)
+    if diagnose is None:
         logger.log("ERROR", f"Unknown provider: {selected}")
         pause()
         return
+    checks = diagnose(instance.server_dir, tunnel_config, server_port, flavor, logger)
 
     for check in checks:
         symbol = f"{C.GREEN}✓{C.RESET}" if check.ok else f"{C.RED}✗{C.RESET}"
@@ -353,10 +425,7 @@ def ngrok_setup_wizard(
     print(f"{C.BOLD}Ngrok Setup Wizard{C.RESET}")
     print_connection_summary(instance)
     print()
-    print("Ngrok requirements:")
-    print(" - The ngrok agent must be installed and reachable by MSM.")
-    print(" - Your ngrok account must be configured with an authtoken.")
-    print(" - TCP endpoints may require billing details on ngrok.")
+    emit_lines(NGROK_REQUIREMENTS)
     if running_on_termux():
         print(
             " - If you installed ngrok through a wrapper, set the binary path to that wrapper."
@@ -444,23 +513,14 @@ def playit_setup_wizard(
     print(f"{C.BOLD}Playit Setup Wizard{C.RESET}")
     print_connection_summary(instance)
     print()
-    print("Playit notes:")
-    print(" - MSM uses `claim generate`, `claim url`, and `claim exchange` for setup.")
-    print(" - MSM uses the playit agent for the managed background session.")
-    print(" - MSM can create or update the Playit tunnel after the agent is linked.")
-    print(" - Playit account approval happens in your browser with a one-time code.")
+    emit_lines(PLAYIT_NOTES)
     print(f" - Local tunnel target defaults to 127.0.0.1:{instance.get_server_port()}.")
     if running_on_termux():
-        print("\nInstall playit on Termux:")
-        print(" pkg update && pkg upgrade")
-        print(" pkg install tur-repo playit")
-        print(" MSM does not need tmux when it manages playit for this server.")
+        emit_lines(PLAYIT_TERMUX_INSTALL)
 
     binary_path = input(f"\nPlayit binary path [{current_binary}]: ").strip() or str(
         current_binary
     )
-    from utils.playit import resolve_playit_binary
-
     resolved_binary = resolve_playit_binary(binary_path)
     if resolved_binary:
         logger.log("INFO", f"Using playit binary at {resolved_binary}")
@@ -704,20 +764,18 @@ def tunnel_setup_wizard(
         config = config_manager.load()
         tunnel = config["servers"][current_server].setdefault("tunnel", {})
         print_header(current_server, runtime)
-        print(f"{C.BOLD}Tunnel Setup Wizard{C.RESET}")
-        print(f"Current provider: {tunnel.get('provider', 'playit')}")
-        print(f"Enabled: {tunnel.get('enabled', False)}")
-        print(f"Binary: {tunnel.get('binary_path', DEFAULT_TUNNEL_BINARIES['playit'])}")
-        print(f"Protocol: {tunnel.get('protocol', 'tcp')}")
+        emit_lines(
+            [
+                f"{C.BOLD}Tunnel Setup Wizard{C.RESET}",
+                f"Current provider: {tunnel.get('provider', 'playit')}",
+                f"Enabled: {tunnel.get('enabled', False)}",
+                f"Binary: {tunnel.get('binary_path', DEFAULT_TUNNEL_BINARIES['playit'])}",
+                f"Protocol: {tunnel.get('protocol', 'tcp')}",
+            ]
+        )
         print_connection_summary(instance)
         print()
-        print(" 1. Setup ngrok")
-        print(" 2. Setup playit")
-        print(" 3. Diagnostics (current provider)")
-        print(" 4. Playit diagnostics")
-        print(" 5. Ngrok diagnostics")
-        print(" 6. Disable tunnel for this server")
-        print(" 0. Back")
+        emit_lines(TUNNEL_WIZARD_MENU)
 
         choice = input(f"\n{C.BOLD}Choose action: {C.RESET}").strip()
         if choice == "0":
@@ -922,31 +980,33 @@ def configure_server(
         config = config_manager.load()
         server_config = config["servers"][current_server]
         print_header(current_server, runtime)
-        print(f"{C.BOLD}Configure {current_server}{C.RESET}")
-        print(f" 1. RAM MB: {server_config['ram_mb']}")
-        print(f" 2. Port: {server_config['server_settings']['port']}")
-        print(f" 3. Auto restart: {server_config['auto_restart']}")
-        print(f" 4. MOTD: {server_config['server_settings']['motd']}")
-        print(f" 5. Max players: {server_config['server_settings']['max-players']}")
-        print(f" 6. Online mode: {server_config['server_settings']['online-mode']}")
-        print(f" 7. Scheduled backups: {server_config['backup_settings']['enabled']}")
-        print(
-            f" 8. Backup interval hours: {server_config['backup_settings']['interval_hours']}"
+        settings = server_config["server_settings"]
+        backups = server_config["backup_settings"]
+        tunnel = server_config["tunnel"]
+        rcon = server_config["rcon"]
+        emit_lines(
+            [
+                f"{C.BOLD}Configure {current_server}{C.RESET}",
+                f" 1. RAM MB: {server_config['ram_mb']}",
+                f" 2. Port: {settings['port']}",
+                f" 3. Auto restart: {server_config['auto_restart']}",
+                f" 4. MOTD: {settings['motd']}",
+                f" 5. Max players: {settings['max-players']}",
+                f" 6. Online mode: {settings['online-mode']}",
+                f" 7. Scheduled backups: {backups['enabled']}",
+                f" 8. Backup interval hours: {backups['interval_hours']}",
+                f" 9. Tunnel enabled: {tunnel['enabled']}",
+                f"10. Tunnel provider: {tunnel['provider']}",
+                f"11. Tunnel binary: {tunnel['binary_path']}",
+                f"12. Tunnel protocol: {tunnel.get('protocol', 'tcp')}",
+                f"13. Tunnel local host: {tunnel.get('local_host', '127.0.0.1')}",
+                f"14. Tunnel local port: {tunnel.get('local_port') or 'auto'}",
+                "15. Tunnel setup wizard",
+                f"16. RCON enabled: {rcon['enabled']}",
+                f"17. RCON password set: {bool(rcon['password'])}",
+                " 0. Back",
+            ]
         )
-        print(f" 9. Tunnel enabled: {server_config['tunnel']['enabled']}")
-        print(f"10. Tunnel provider: {server_config['tunnel']['provider']}")
-        print(f"11. Tunnel binary: {server_config['tunnel']['binary_path']}")
-        print(f"12. Tunnel protocol: {server_config['tunnel'].get('protocol', 'tcp')}")
-        print(
-            f"13. Tunnel local host: {server_config['tunnel'].get('local_host', '127.0.0.1')}"
-        )
-        print(
-            f"14. Tunnel local port: {server_config['tunnel'].get('local_port') or 'auto'}"
-        )
-        print("15. Tunnel setup wizard")
-        print(f"16. RCON enabled: {server_config['rcon']['enabled']}")
-        print(f"17. RCON password set: {bool(server_config['rcon']['password'])}")
-        print(" 0. Back")
 
         choice = input(f"\n{C.BOLD}Choose setting: {C.RESET}").strip()
         if choice == "0":
@@ -1216,15 +1276,15 @@ def edit_server_files(
         eula_status = load_properties(eula_path).get("eula", "false")
 
         print_header(current_server, runtime)
-        print(f"{C.BOLD}Server file editor{C.RESET}")
-        print(f" server.properties: {properties_path}")
-        print(f" eula.txt: {eula_path}")
-        print(f" EULA accepted: {eula_status}")
-        print("\n 1. Show current properties")
-        print(" 2. Set or update a property")
-        print(" 3. Delete a property")
-        print(" 4. Toggle EULA")
-        print(" 0. Back")
+        emit_lines(
+            [
+                f"{C.BOLD}Server file editor{C.RESET}",
+                f" server.properties: {properties_path}",
+                f" eula.txt: {eula_path}",
+                f" EULA accepted: {eula_status}",
+                *SERVER_FILE_EDITOR_MENU,
+            ]
+        )
 
         choice = input(f"\n{C.BOLD}Choose action: {C.RESET}").strip()
         if choice == "0":
@@ -1299,12 +1359,7 @@ def world_manager(
 
     while True:
         print_header(current_server, runtime)
-        print(f"{C.BOLD}World manager{C.RESET}")
-        print(" 1. Create backup")
-        print(" 2. List backups")
-        print(" 3. Restore backup")
-        print(" 4. Delete backup")
-        print(" 0. Back")
+        emit_lines([f"{C.BOLD}World manager{C.RESET}", *WORLD_MANAGER_MENU])
 
         choice = input(f"\n{C.BOLD}Choose action: {C.RESET}").strip()
         if choice == "0":
@@ -1469,22 +1524,15 @@ def main() -> None:
         )
 
         print_header(current_server, runtime)
-        print(f"{C.BOLD}{current_server}{C.RESET} | Status: {status}")
-        print(f"{C.DIM}{flavor_name} {version}{C.RESET}")
+        emit_lines(
+            [
+                f"{C.BOLD}{current_server}{C.RESET} | Status: {status}",
+                f"{C.DIM}{flavor_name} {version}{C.RESET}",
+            ]
+        )
         print_connection_summary(instance)
         print()
-        print(" 1. Start server")
-        print(" 2. Stop server")
-        print(" 3. Install or update server")
-        print(" 4. Configure server")
-        print(" 5. Edit server.properties and eula.txt")
-        print(" 6. Attach to console")
-        print(" 7. World manager")
-        print(" 8. Send command")
-        print(" 9. Statistics")
-        print("10. Create new server")
-        print("11. Switch server")
-        print(" 0. Exit")
+        emit_lines(MAIN_MENU)
 
         choice = input(f"\n{C.BOLD}Choose action: {C.RESET}").strip()
         try:
@@ -1528,13 +1576,14 @@ def main() -> None:
                         .lower()
                     )
                     if leave_running == "n":
-                        for server_name in runtime.running_servers():
-                            runtime.get_instance(server_name).stop()
+                        runtime.stop_all()
+                db_manager.close()
                 raise SystemExit(0)
             else:
                 logger.log("ERROR", "Invalid menu selection.")
                 pause()
         except KeyboardInterrupt as exc:
+            db_manager.close()
             raise SystemExit(0) from exc
         except Exception as exc:
             logger.log("CRITICAL", f"Unexpected error: {exc}")
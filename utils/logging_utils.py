@@ -15,9 +15,14 @@ class EnhancedLogger:
     """Log to file and stdout with lightweight structured context."""
 
     def __init__(
-        self, log_file: str | os.PathLike[str], max_size: int, retention_days: int
+        self,
+        log_file: str | os.PathLike[str],
+        max_size: int,
+        retention_days: int,
+        name: str = "MSM",
     ):
         self.log_file = Path(log_file)
+        self.name = name
         self.max_size = max_size
         self.retention_days = retention_days
         self._setup_logging()
@@ -25,21 +30,24 @@ class EnhancedLogger:
     def _setup_logging(self) -> None:
         self.log_file.parent.mkdir(parents=True, exist_ok=True)
         self._rotate_log_if_needed()
-        self.logger = logging.getLogger("MSM")
+        self.logger = logging.getLogger(self.name)
         self.logger.setLevel(logging.DEBUG)
         self.logger.handlers.clear()
-        handler = logging.FileHandler(self.log_file, encoding="utf-8")
-        handler.setFormatter(
+        file_handler = logging.FileHandler(self.log_file, encoding="utf-8")
+        file_handler.setFormatter(
             logging.Formatter(
                 fmt="%(asctime)s [%(levelname)8s] %(message)s",
                 datefmt="%Y-%m-%d %H:%M:%S",
             )
         )
-        self.logger.addHandler(handler)
+        self.logger.addHandler(file_handler)
         self.logger.propagate = False
 
     def _rotate_log_if_needed(self) -> None:
-        if not self.log_file.exists() or self.log_file.stat().st_size <= self.max_size:
+        try:
+            if self.log_file.stat().st_size <= self.max_size:
+                return
+        except FileNotFoundError:
             return
         backup_file = self.log_file.with_suffix(
             f"{self.log_file.suffix}.{int(time.time())}"
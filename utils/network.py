@@ -2,6 +2,12 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+import platform
+import tarfile
+import urllib.request
+import zipfile
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any
@@ -13,6 +19,7 @@ from urllib3.util.retry import Retry
 from core.constants import (
     DOWNLOAD_CHUNK_SIZE,
     MAX_RETRIES,
+    NGROK_API_URL,
     NGROK_TIMEOUT,
     PAPER_VERSION_LOOKBACK,
     REQUEST_TIMEOUT,
@@ -74,61 +81,55 @@ def is_snapshot_version(version: str) -> bool:
 
 
 def _fetch_paper_build(
+    session: requests.Session,
     api_base: str,
     version: str,
     logger=None,
 ) -> tuple[str, dict[str, Any]] | None:
-    session = create_robust_session()
-    try:
-        response = safe_request(
-            session,
-            "GET",
-            f"{api_base}/versions/{version}/builds",
-            logger=logger,
-        )
-        if not response:
-            return None
-        builds = response.json().get("builds", [])
-        if not builds:
-            return None
-        latest = builds[-1]
-        application = latest.get("downloads", {}).get("application", {})
-        return (
-            version,
-            {
-                "latest_build": latest.get("build"),
-                "download_name": application.get("name"),
-                "sha256": application.get("sha256"),
-                "is_snapshot": is_snapshot_version(version),
-            },
-        )
-    finally:
-        session.close()
+    response = safe_request(
+        session,
+        "GET",
+        f"{api_base}/versions/{version}/builds",
+        logger=logger,
+    )
+    if not response:
+        return None
+    builds = response.json().get("builds", [])
+    if not builds:
+        return None
+    latest = builds[-1]
+    application = latest.get("downloads", {}).get("application", {})
+    return (
+        version,
+        {
+            "latest_build": latest.get("build"),
+            "download_name": application.get("name"),
+            "sha256": application.get("sha256"),
+            "is_snapshot": is_snapshot_version(version),
+        },
+    )
 
 
 def _fetch_purpur_build(
+    session: requests.Session,
     api_base: str,
     version: str,
     logger=None,
 ) -> tuple[str, dict[str, Any]] | None:
-    session = create_robust_session()
-    try:
-        response = safe_request(session, "GET", f"{api_base}/{version}", logger=logger)
-        if not response:
-            return None
-        latest = response.json().get("builds", {}).get("latest")
-        if latest is None:
-            return None
-        return (
-            version,
-            {
-                "latest_build": latest,
-                "download_url": f"{api_base}/{version}/{latest}/download",
-                "is_snapshot": is_snapshot_version(version),
-            },
-        )
-    finally:
-        session.close()
+    response = safe_request(session, "GET", f"{api_base}/{version}", logger=logger)
+    if not response:
+        return None
+    latest = response.json().get("builds", {}).get("latest")
+    if latest is None:
+        return None
+    return (
+        version,
+        {
+            "latest_build": latest,
+            "download_url": f"{api_base}/{version}/{latest}/download",
+            "is_snapshot": is_snapshot_version(version),
+        },
+    )
 
 
 def get_paper_like_versions(
@@ -153,7 +154,9 @@ def get_paper_like_versions(
             max_workers=min(8, len(selected_versions) or 1)
         ) as executor:
             futures = {
-                executor.submit(_fetch_paper_build, api_base, version, logger): version
+                executor.submit(
+                    _fetch_paper_build, session, api_base, version, logger
+                ): version
                 for version in selected_versions
             }
             for future in as_completed(futures):
@@ -192,7 +195,9 @@ def get_purpur_versions(
             max_workers=min(8, len(selected_versions) or 1)
         ) as executor:
             futures = {
-                executor.submit(_fetch_purpur_build, api_base, version, logger): version
+                executor.submit(
+                    _fetch_purpur_build, session, api_base, version, logger
+                ): version
                 for version in selected_versions
             }
             for future in as_completed(futures):
@@ -235,6 +240,22 @@ def get_vanilla_versions(
         session.close()
 
 
+def _fetch_meta_endpoints(
+    session: requests.Session,
+    api_base: str,
+    endpoints: tuple[str, ...],
+    logger=None,
+) -> list[requests.Response | None]:
+    with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+        futures = [
+            executor.submit(
+                safe_request, session, "GET", f"{api_base}/{endpoint}", logger=logger
+            )
+            for endpoint in endpoints
+        ]
+        return [future.result() for future in futures]
+
+
 def get_fabric_versions(
     flavor: str,
     include_snapshots: bool = False,
@@ -243,12 +264,8 @@ def get_fabric_versions(
     api_base = SERVER_FLAVORS[flavor]["api_base"]
     session = create_robust_session()
     try:
-        game_response = safe_request(session, "GET", f"{api_base}/game", logger=logger)
-        loader_response = safe_request(
-            session, "GET", f"{api_base}/loader", logger=logger
-        )
-        installer_response = safe_request(
-            session, "GET", f"{api_base}/installer", logger=logger
+        game_response, loader_response, installer_response = _fetch_meta_endpoints(
+            session, api_base, ("game", "loader", "installer"), logger
         )
         if not all([game_response, loader_response, installer_response]):
             return {}
@@ -275,12 +292,8 @@ def get_quilt_versions(
     api_base = SERVER_FLAVORS[flavor]["api_base"]
     session = create_robust_session()
     try:
-        game_response = safe_request(session, "GET", f"{api_base}/game", logger=logger)
-        loader_response = safe_request(
-            session, "GET", f"{api_base}/loader", logger=logger
-        )
-        installer_response = safe_request(
-            session, "GET", f"{api_base}/installer", logger=logger
+        game_response, loader_response, installer_response = _fetch_meta_endpoints(
+            session, api_base, ("game", "loader", "installer"), logger
         )
         if not all([game_response, loader_response, installer_response]):
             return {}
@@ -411,6 +424,9 @@ def download_server_binary(
         logger=logger,
     )
     target_path = Path(server_dir) / target_filename
+    partial_path = target_path.with_name(f"{target_filename}.part")
+    expected_sha256 = version_info.get("sha256")
+    digest = hashlib.sha256()
     session = create_robust_session()
     try:
         response = safe_request(
@@ -419,13 +435,26 @@ def download_server_binary(
         if not response:
             raise RuntimeError(f"Download failed for {download_url}")
         target_path.parent.mkdir(parents=True, exist_ok=True)
-        with target_path.open("wb") as handle:
+        # Stream into a side file and hash as we go, so a truncated or corrupt
+        # download never replaces a working server binary.
+        with partial_path.open("wb") as handle:
             for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                 if chunk:
                     handle.write(chunk)
+                    digest.update(chunk)
+        if expected_sha256 and digest.hexdigest() != expected_sha256.lower():
+            raise RuntimeError(f"Checksum mismatch for {download_url}")
+        # Only the central directory is read, so a truncated jar fails here
+        # instead of at server start.
+        if target_filename.endswith(".jar") and not zipfile.is_zipfile(partial_path):
+            raise RuntimeError(
+                f"Downloaded file from {download_url} is not a valid jar"
+            )
+        partial_path.replace(target_path)
         return target_path
     finally:
         session.close()
+        partial_path.unlink(missing_ok=True)
 
 
 def get_ngrok_public_url(
@@ -433,30 +462,21 @@ def get_ngrok_public_url(
     logger=None,
     timeout: int | float = NGROK_TIMEOUT,
 ) -> str | None:
-    session = create_robust_session()
     try:
-        response = safe_request(
-            session,
-            "GET",
-            "http://127.0.0.1:4040/api/tunnels",
-            logger=logger,
-            timeout=timeout,
-        )
-        if not response:
-            return None
-        for tunnel in response.json().get("tunnels", []):
-            address = tunnel.get("config", {}).get("addr", "")
-            if address.endswith(f":{port}") or address.endswith(str(port)):
-                return tunnel.get("public_url")
+        with urllib.request.urlopen(NGROK_API_URL, timeout=timeout) as response:
+            payload = json.loads(response.read())
+    except (OSError, ValueError) as exc:
+        if logger:
+            logger.log("WARNING", f"Ngrok API request failed: {exc}")
         return None
-    finally:
-        session.close()
+    for tunnel in payload.get("tunnels", []):
+        address = tunnel.get("config", {}).get("addr", "")
+        if address.endswith(f":{port}") or address.endswith(str(port)):
+            return tunnel.get("public_url")
+    return None
 
 
 def download_ngrok_binary(logger=None) -> Path | None:
-    import platform
-    import tarfile
-
     arch = platform.machine().lower()
     if arch in ("aarch64", "arm64"):
         ngrok_arch = "arm64"
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import shutil
 from typing import Any
-import socket
 import subprocess
 import time
 from pathlib import Path
@@ -22,10 +21,12 @@ from core.constants import (
 from utils.network import get_ngrok_public_url
 from utils.system import (
     is_pid_running,
+    is_tcp_port_open,
     read_pid_file,
     read_text_file,
     remove_file,
     write_text_file,
+    write_text_if_changed,
 )
 from utils.tunnel_models import TunnelCheck, TunnelStatus
 
@@ -61,7 +62,8 @@ def get_saved_ngrok_endpoint(server_dir: Path) -> str | None:
 
 def save_ngrok_endpoint(server_dir: Path, endpoint: str) -> None:
     """Persist the current ngrok public endpoint."""
-    write_text_file(server_dir / NGROK_ENDPOINT_FILE_NAME, endpoint)
+    # Status checks call this on every refresh.
+    write_text_if_changed(server_dir / NGROK_ENDPOINT_FILE_NAME, endpoint)
 
 
 # ---------------------------------------------------------------------------
@@ -72,8 +74,6 @@ def save_ngrok_endpoint(server_dir: Path, endpoint: str) -> None:
 def _read_ngrok_log_tail(server_dir: Path, line_count: int = 10) -> str:
     """Return the last *line_count* lines of the ngrok log."""
     log_path = server_dir / ".msm.ngrok.log"
-    if not log_path.exists():
-        return ""
     try:
         lines = log_path.read_text(encoding="utf-8", errors="replace").splitlines()
     except OSError:
@@ -160,17 +160,31 @@ def start_ngrok_agent(
     process = subprocess.Popen(
         command,
         cwd=server_dir,
+        stdin=subprocess.DEVNULL,
         stdout=log_handle,
         stderr=subprocess.STDOUT,
         text=True,
+        start_new_session=True,
     )
     write_text_file(server_dir / TUNNEL_PID_FILE_NAME, str(process.pid))
 
-    deadline = time.monotonic() + 3.0
+    # The API refuses connections until the agent is up, so poll without the
+    # logger and warn once if it never answers.
+    poll_deadline = time.monotonic() + min(NGROK_TIMEOUT, 15)
+    delay = 0.05
+    public_url: str | None = None
     exit_code = process.poll()
-    while exit_code is None and time.monotonic() < deadline:
-        time.sleep(0.1)
+    while exit_code is None and time.monotonic() < poll_deadline:
+        public_url = get_ngrok_public_url(port, timeout=2)
+        if public_url:
+            break
+        time.sleep(delay)
+        delay = min(delay * 2, 0.5)
         exit_code = process.poll()
+    if exit_code is None and not public_url and logger:
+        logger.log(
+            "WARNING", "Ngrok API did not report a public URL before timing out."
+        )
 
     if exit_code is not None:
         remove_file(server_dir / TUNNEL_PID_FILE_NAME)
@@ -181,23 +195,13 @@ def start_ngrok_agent(
             TunnelStatus(
                 provider="ngrok",
                 state=TUNNEL_STATUS_FAILED,
-                message=f"Ngrok exited immediately (code {exit_code}). {tail}",
+                message=f"Ngrok exited during startup (code {exit_code}). {tail}",
             ),
             None,
         )
 
     log_handle.flush()
 
-    # Poll the ngrok API for the public URL.
-    poll_timeout = min(NGROK_TIMEOUT, 15)
-    poll_deadline = time.monotonic() + poll_timeout
-    public_url: str | None = None
-    while time.monotonic() < poll_deadline:
-        public_url = get_ngrok_public_url(port, logger=logger, timeout=2)
-        if public_url:
-            break
-        time.sleep(1)
-
     if public_url:
         save_ngrok_endpoint(server_dir, public_url)
         return (
@@ -277,14 +281,7 @@ def diagnose_ngrok(
 
     local_host = tunnel_config.get("local_host", "127.0.0.1")
     local_port = tunnel_config.get("local_port") or server_port
-    try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(2)
-        result = sock.connect_ex((local_host, int(local_port)))
-        sock.close()
-        port_ok = result == 0
-    except OSError:
-        port_ok = False
+    port_ok = is_tcp_port_open(local_host, int(local_port))
     checks.append(
         TunnelCheck(
             name="Local TCP port reachable",
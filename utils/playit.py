@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import shutil
-import socket
 import subprocess
 import time
 from pathlib import Path
@@ -23,11 +22,13 @@ from core.constants import (
 )
 from utils.system import (
     is_pid_running,
+    is_tcp_port_open,
     read_pid_file,
     read_text_file,
     remove_file,
     running_on_termux,
     write_text_file,
+    write_text_if_changed,
 )
 from utils.tunnel_models import TunnelCheck, TunnelStatus
 from utils.tunnels import (
@@ -75,7 +76,8 @@ def get_saved_playit_endpoint(server_dir: Path) -> str | None:
 
 def save_playit_endpoint(server_dir: Path, endpoint: str) -> None:
     """Persist the current playit public endpoint."""
-    write_text_file(server_dir / PLAYIT_ENDPOINT_FILE_NAME, endpoint)
+    # Status checks call this on every refresh.
+    write_text_if_changed(server_dir / PLAYIT_ENDPOINT_FILE_NAME, endpoint)
 
 
 # ---------------------------------------------------------------------------
@@ -86,8 +88,6 @@ def save_playit_endpoint(server_dir: Path, endpoint: str) -> None:
 def read_playit_log_tail(server_dir: Path, line_count: int = 80) -> str:
     """Return the last *line_count* lines of the playit log."""
     log_path = server_dir / ".msm.playit.log"
-    if not log_path.exists():
-        return ""
     try:
         lines = log_path.read_text(encoding="utf-8", errors="replace").splitlines()
     except OSError:
@@ -207,9 +207,11 @@ def start_playit_agent(
     process = subprocess.Popen(
         command,
         cwd=server_dir,
+        stdin=subprocess.DEVNULL,
         stdout=log_handle,
         stderr=subprocess.STDOUT,
         text=True,
+        start_new_session=True,
     )
     write_text_file(server_dir / TUNNEL_PID_FILE_NAME, str(process.pid))
 
@@ -308,14 +310,7 @@ def diagnose_playit(
     local_host = tunnel_config.get("local_host", "127.0.0.1")
     local_port = tunnel_config.get("local_port") or server_port
     if protocol == "tcp":
-        try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(2)
-            result = sock.connect_ex((local_host, int(local_port)))
-            sock.close()
-            port_ok = result == 0
-        except OSError:
-            port_ok = False
+        port_ok = is_tcp_port_open(local_host, int(local_port))
         checks.append(
             TunnelCheck(
                 name="Local TCP port reachable",
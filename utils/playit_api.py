@@ -42,8 +42,6 @@ def save_playit_session(session_key: str) -> Path:
 
 def load_playit_session() -> str | None:
     path = _session_file()
-    if not path.exists():
-        return None
     try:
         payload = json.loads(path.read_text(encoding="utf-8"))
     except (OSError, json.JSONDecodeError):
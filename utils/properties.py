@@ -4,11 +4,20 @@ from __future__ import annotations
 
 from pathlib import Path
 
+_PROPERTIES_CACHE: dict[Path, tuple[tuple[int, int], dict[str, str]]] = {}
+
 
 def load_properties(path: str | Path) -> dict[str, str]:
     file_path = Path(path)
-    if not file_path.exists():
+    try:
+        stat_result = file_path.stat()
+    except FileNotFoundError:
+        _PROPERTIES_CACHE.pop(file_path, None)
         return {}
+    signature = (stat_result.st_mtime_ns, stat_result.st_size)
+    cached = _PROPERTIES_CACHE.get(file_path)
+    if cached and cached[0] == signature:
+        return dict(cached[1])
     properties: dict[str, str] = {}
     for raw_line in file_path.read_text(encoding="utf-8").splitlines():
         line = raw_line.strip()
@@ -16,7 +25,8 @@ def load_properties(path: str | Path) -> dict[str, str]:
             continue
         key, value = line.split("=", 1)
         properties[key.strip()] = value.strip()
-    return properties
+    _PROPERTIES_CACHE[file_path] = (signature, properties)
+    return dict(properties)
 
 
 def write_properties(
@@ -32,3 +42,5 @@ def write_properties(
     for key, value in properties.items():
         lines.append(f"{key}={value}")
     file_path.write_text("\n".join(lines).rstrip() + "\n", encoding="utf-8")
+    # A rewrite can land within the same mtime tick, so never trust the old parse.
+    _PROPERTIES_CACHE.pop(file_path, None)
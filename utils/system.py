@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import errno
 import ipaddress
 import os
+import select
 import shlex
 import shutil
 import socket
@@ -12,7 +14,7 @@ import sys
 import time
 import uuid
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 import psutil
 
@@ -20,9 +22,14 @@ from core.constants import (
     ALLOWED_FILENAME_CHARS,
     COLLAPSE_DOTS_PATTERN,
     COMMON_JAVA_HOME_BASES,
+    DEFAULT_ROUTE_FILE,
     INVALID_FILENAME_CHARS,
+    JAVA_VERSION_PATTERN,
+    LAN_ADDRESS_CACHE_TTL,
     MAX_FILENAME_LENGTH,
     MAX_RAM_PERCENTAGE,
+    PROC_DIR,
+    SCREEN_SESSION_PATTERN,
 )
 
 
@@ -149,7 +156,31 @@ def get_screen_name(server_name: str) -> str:
     return f"mc_{sanitize_input(server_name)}"
 
 
+def read_process_cmdlines() -> bytes:
+    """Return every readable /proc cmdline, NUL-separated, one process per line."""
+    cmdlines: list[bytes] = []
+    with os.scandir(PROC_DIR) as entries:
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
+            try:
+                with open(os.path.join(entry.path, "cmdline"), "rb") as handle:
+                    cmdlines.append(handle.read())
+            except OSError:
+                continue
+    return b"\n".join(cmdlines)
+
+
 def screen_session_exists(screen_name: str, logger=None) -> bool:
+    try:
+        blob = read_process_cmdlines()
+    except OSError:
+        blob = None
+    if blob is not None:
+        target = screen_name.encode("utf-8")
+        return any(
+            match.group(1) == target for match in SCREEN_SESSION_PATTERN.finditer(blob)
+        )
     result = run_command(
         ["screen", "-ls", screen_name],
         logger=logger,
@@ -185,8 +216,6 @@ def wait_for_pid_file(
 
 def read_pid_file(path: str | os.PathLike[str]) -> int | None:
     file_path = Path(path)
-    if not file_path.exists():
-        return None
     try:
         return int(file_path.read_text(encoding="utf-8").strip())
     except (OSError, ValueError):
@@ -195,8 +224,6 @@ def read_pid_file(path: str | os.PathLike[str]) -> int | None:
 
 def read_text_file(path: str | os.PathLike[str]) -> str | None:
     file_path = Path(path)
-    if not file_path.exists():
-        return None
     try:
         return file_path.read_text(encoding="utf-8").strip()
     except OSError:
@@ -209,6 +236,13 @@ def write_text_file(path: str | os.PathLike[str], value: str) -> None:
     file_path.write_text(value, encoding="utf-8")
 
 
+def write_text_if_changed(path: str | os.PathLike[str], value: str) -> bool:
+    if read_text_file(path) == value:
+        return False
+    write_text_file(path, value)
+    return True
+
+
 def remove_file(path: str | os.PathLike[str]) -> None:
     Path(path).unlink(missing_ok=True)
 
@@ -229,21 +263,62 @@ def is_pid_running(pid: int | None, expected_names: list[str] | None = None) ->
         return False
 
 
+def wait_for_pid_exit(pid: int, timeout: float) -> bool:
+    """Wait for *pid* to exit; return False if it is still alive after *timeout*."""
+    pidfd_open = getattr(os, "pidfd_open", None)
+    # Older Android seccomp policies kill the caller on pidfd_open, so Termux
+    # keeps using psutil's polling wait.
+    if pidfd_open is not None and not running_on_termux():
+        try:
+            pidfd = pidfd_open(pid)
+        except ProcessLookupError:
+            return True
+        except OSError:
+            pidfd = None
+        if pidfd is not None:
+            try:
+                poller = select.poll()
+                poller.register(pidfd, select.POLLIN)
+                return bool(poller.poll(timeout * 1000))
+            finally:
+                os.close(pidfd)
+    try:
+        psutil.Process(pid).wait(timeout=timeout)
+    except psutil.NoSuchProcess:
+        return True
+    except psutil.TimeoutExpired:
+        return False
+    return True
+
+
 def _parse_java_version(output: str) -> str | None:
-    for token in output.replace("\n", " ").split():
-        if token.startswith('"') and token.endswith('"'):
-            cleaned = token.strip('"')
-            if not cleaned or not cleaned[0].isdigit():
-                continue
-            parts = cleaned.split(".")
-            # Java 8 and earlier use 1.x.y versioning
-            if parts[0] == "1" and len(parts) > 1:
-                return parts[1]
-            return parts[0]
-    return None
+    match = JAVA_VERSION_PATTERN.search(output)
+    if not match:
+        return None
+    major, minor = match.groups()
+    # Java 8 and earlier use 1.x.y versioning
+    if major == "1" and minor:
+        return minor
+    return major
+
+
+_JAVA_VERSION_CACHE: dict[str, tuple[tuple[int, int], str]] = {}
 
 
 def detect_java_version(java_binary: str, logger=None) -> str | None:
+    # Spawning a JVM costs hundreds of milliseconds on Termux, so remember the
+    # answer per binary until the file on disk changes.
+    binary_path = os.path.realpath(shutil.which(java_binary) or java_binary)
+    try:
+        stat_result = os.stat(binary_path)
+    except OSError:
+        signature = None
+    else:
+        signature = (stat_result.st_mtime_ns, stat_result.st_size)
+        cached = _JAVA_VERSION_CACHE.get(binary_path)
+        if cached and cached[0] == signature:
+            return cached[1]
+
     result = run_command(
         [java_binary, "-version"],
         logger=logger,
@@ -254,7 +329,10 @@ def detect_java_version(java_binary: str, logger=None) -> str | None:
     if not result:
         return None
     combined_output = "\n".join(filter(None, [result.stdout, result.stderr]))
-    return _parse_java_version(combined_output)
+    version = _parse_java_version(combined_output)
+    if version and signature:
+        _JAVA_VERSION_CACHE[binary_path] = (signature, version)
+    return version
 
 
 def get_required_java(version: str | None) -> str:
@@ -387,14 +465,98 @@ def format_bytes(size_bytes: int) -> str:
     return f"{size_bytes}B"
 
 
-def get_local_ipv4_addresses() -> list[str]:
-    addresses: set[str] = set()
+_LAN_ADDRESS_CACHE: dict[str, Any] = {}
+_CGNAT_NETWORK = ipaddress.IPv4Network("100.64.0.0/10")
+
+
+def _default_route_interface() -> str | None:
+    try:
+        with DEFAULT_ROUTE_FILE.open(encoding="utf-8") as handle:
+            next(handle, None)
+            for line in handle:
+                fields = line.split()
+                if len(fields) > 1 and fields[1] == "00000000":
+                    return fields[0]
+    except OSError:
+        return None
+    return None
+
+
+def probe_tcp_ports(
+    targets: Iterable[tuple[str, int]], timeout: float = 2.0
+) -> dict[tuple[str, int], bool]:
+    """Connect to every target at once and wait on them with a single select()."""
+    results: dict[tuple[str, int], bool] = {}
+    pending: dict[socket.socket, tuple[str, int]] = {}
+    try:
+        for target in targets:
+            results[target] = False
+            try:
+                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            except OSError:
+                continue
+            sock.setblocking(False)
+            try:
+                code = sock.connect_ex(target)
+            except OSError:
+                sock.close()
+                continue
+            if code in (errno.EINPROGRESS, errno.EWOULDBLOCK):
+                pending[sock] = target
+                continue
+            results[target] = code == 0
+            sock.close()
+
+        deadline = time.monotonic() + timeout
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            _, writable, _ = select.select([], list(pending), [], remaining)
+            if not writable:
+                break
+            for sock in writable:
+                target = pending.pop(sock)
+                error = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                results[target] = error == 0
+                sock.close()
+    finally:
+        for sock in pending:
+            sock.close()
+    return results
+
+
+def is_tcp_port_open(host: str, port: int, timeout: float = 2.0) -> bool:
+    target = (host, int(port))
+    return probe_tcp_ports([target], timeout=timeout)[target]
+
+
+def _parse_local_ipv4(address: str) -> ipaddress.IPv4Address | None:
+    try:
+        parsed = ipaddress.IPv4Address(address)
+    except ValueError:
+        return None
+    return None if parsed.is_loopback else parsed
+
+
+def _local_address_rank(parsed: ipaddress.IPv4Address) -> tuple[int, str]:
+    # Carrier-grade NAT space (common on mobile data) is neither private nor
+    # publicly reachable, so list it after RFC 1918 LAN addresses.
+    if parsed.is_private:
+        return (0, str(parsed))
+    if parsed in _CGNAT_NETWORK:
+        return (1, str(parsed))
+    return (2, str(parsed))
+
+
+def _collect_local_ipv4_addresses() -> list[str]:
+    addresses: set[ipaddress.IPv4Address] = set()
     try:
         with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as probe_socket:
             probe_socket.connect(("8.8.8.8", 80))
-            address = probe_socket.getsockname()[0]
-            if address and not address.startswith("127."):
-                addresses.add(address)
+            parsed = _parse_local_ipv4(probe_socket.getsockname()[0])
+            if parsed:
+                addresses.add(parsed)
     except OSError:
         pass
 
@@ -403,14 +565,28 @@ def get_local_ipv4_addresses() -> list[str]:
             for address_info in interface_addresses:
                 if address_info.family != socket.AF_INET:
                     continue
-                address = address_info.address
-                if address and not address.startswith("127."):
-                    addresses.add(address)
+                parsed = _parse_local_ipv4(address_info.address)
+                if parsed:
+                    addresses.add(parsed)
     except Exception:
         pass
 
-    def sort_key(address: str) -> tuple[int, str]:
-        parsed = ipaddress.ip_address(address)
-        return (0 if parsed.is_private else 1, address)
+    ordered = sorted(addresses, key=_local_address_rank)
+    return [str(parsed) for parsed in ordered]
 
-    return sorted(addresses, key=sort_key)
+
+def get_local_ipv4_addresses() -> list[str]:
+    """Return LAN addresses, reusing a short-lived result while the route is stable."""
+    now = time.monotonic()
+    interface = _default_route_interface()
+    if (
+        _LAN_ADDRESS_CACHE
+        and _LAN_ADDRESS_CACHE["interface"] == interface
+        and now - _LAN_ADDRESS_CACHE["timestamp"] < LAN_ADDRESS_CACHE_TTL
+    ):
+        return list(_LAN_ADDRESS_CACHE["addresses"])
+    addresses = _collect_local_ipv4_addresses()
+    _LAN_ADDRESS_CACHE.update(
+        {"interface": interface, "timestamp": now, "addresses": addresses}
+    )
+    return list(addresses)